@@ -21,6 +21,7 @@
 import asyncio
 import contextlib
 import copy
+import logging
 import pickle
 from datetime import datetime
 from types import TracebackType
@@ -3464,27 +3465,24 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
             with res._unfrozen():
                 res.parse_mode = DefaultValue.get_value(res.parse_mode)
         if hasattr(res, "input_message_content") and res.input_message_content:
-            if hasattr(res.input_message_content, "parse_mode"):
+            has_parse_mode = hasattr(res.input_message_content, "parse_mode")
+            has_link_preview_options = hasattr(res.input_message_content, "link_preview_options")
+            if has_parse_mode or has_link_preview_options:
                 if not copied:
                     res = copy.copy(res)
-                    copied = True
 
+                # InputTextMessageContent has both attributes, so we make sure to copy it only once
                 with res._unfrozen():
                     res.input_message_content = copy.copy(res.input_message_content)
                 with res.input_message_content._unfrozen():
-                    res.input_message_content.parse_mode = DefaultValue.get_value(
-                        res.input_message_content.parse_mode
-                    )
-            if hasattr(res.input_message_content, "link_preview_options"):
-                if not copied:
-                    res = copy.copy(res)
-
-                with res._unfrozen():
-                    res.input_message_content = copy.copy(res.input_message_content)
-                with res.input_message_content._unfrozen():
-                    res.input_message_content.link_preview_options = DefaultValue.get_value(
-                        res.input_message_content.link_preview_options
-                    )
+                    if has_parse_mode:
+                        res.input_message_content.parse_mode = DefaultValue.get_value(
+                            res.input_message_content.parse_mode
+                        )
+                    if has_link_preview_options:
+                        res.input_message_content.link_preview_options = DefaultValue.get_value(
+                            res.input_message_content.link_preview_options
+                        )
 
         return res
 
@@ -4372,10 +4370,11 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
             ),
         )
 
-        if result:
-            self._LOGGER.debug("Getting updates: %s", [u["update_id"] for u in result])
-        else:
+        if not result:
             self._LOGGER.debug("No new updates found.")
+        elif self._LOGGER.isEnabledFor(logging.DEBUG):
+            # Only build the list of update ids if it's actually going to be logged
+            self._LOGGER.debug("Getting updates: %s", [u["update_id"] for u in result])
 
         try:
             return Update.de_list(result, self)
@@ -9259,10 +9258,16 @@ CUSTOM_EMOJI_IDENTIFIER_LIMIT` custom emoji identifiers can be specified.
 
     def to_dict(self, recursive: bool = True) -> JSONDict:  # noqa: ARG002
         """See :meth:`telegram.TelegramObject.to_dict`."""
-        data: JSONDict = {"id": self.id, "username": self.username, "first_name": self.first_name}
+        # All the properties are shortcuts for `self.bot`, so we access it only once
+        bot_user = self.bot
+        data: JSONDict = {
+            "id": bot_user.id,
+            "username": bot_user.username,
+            "first_name": bot_user.first_name,
+        }
 
-        if self.last_name:
-            data["last_name"] = self.last_name
+        if bot_user.last_name:
+            data["last_name"] = bot_user.last_name
 
         return data
 
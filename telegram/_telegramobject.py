@@ -100,6 +100,9 @@ class TelegramObject:
     # just check if `__INIT_PARAMS is None`, since subclasses use the parent class' __INIT_PARAMS
     # unless it's overridden
     __INIT_PARAMS_CHECK: Optional[Type["TelegramObject"]] = None
+    # Used to cache the names of the slots of each class, see _get_attrs_names. The keys are
+    # tuples of the class and the value of the `include_private` argument
+    __SLOT_NAMES: ClassVar[Dict[Tuple[type, bool], Tuple[str, ...]]] = {}
 
     def __init__(self, *, api_kwargs: Optional[JSONDict] = None) -> None:
         # Setting _frozen to `False` here means that classes without arguments still need to
@@ -477,7 +480,7 @@ class TelegramObject:
         if not data:
             return ()
 
-        return tuple(obj for obj in (cls.de_json(d, bot) for d in data) if obj is not None)
+        return tuple(obj for d in data if (obj := cls.de_json(d, bot)) is not None)
 
     @contextmanager
     def _unfrozen(self: Tele_co) -> Iterator[Tele_co]:
@@ -533,18 +536,28 @@ class TelegramObject:
         Returns:
             Iterator[:obj:`str`]: An iterator over the names of the attributes of this object.
         """
-        # We want to get all attributes for the class, using self.__slots__ only includes the
-        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
-        # and then get their attributes. The `[:-1]` slice excludes the `object` class
-        all_slots = (s for c in self.__class__.__mro__[:-1] for s in c.__slots__)  # type: ignore
-        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
-        all_attrs = (
-            chain(all_slots, self.__dict__.keys()) if hasattr(self, "__dict__") else all_slots
-        )
+        # The slots only depend on the class, so we compute them only once per class
+        cache_key = (self.__class__, include_private)
+        try:
+            slot_names = self.__SLOT_NAMES[cache_key]
+        except KeyError:
+            # We want to get all attributes for the class, using self.__slots__ only includes the
+            # attributes used by that class itself, and not its superclass(es). Hence, we get its
+            # MRO and then get their attributes. The `[:-1]` slice excludes the `object` class
+            all_slots = (
+                s for c in self.__class__.__mro__[:-1] for s in c.__slots__  # type: ignore
+            )
+            slot_names = self.__SLOT_NAMES[cache_key] = tuple(
+                s for s in all_slots if include_private or not s.startswith("_")
+            )
+
+        if not hasattr(self, "__dict__"):
+            return iter(slot_names)
 
+        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
         if include_private:
-            return all_attrs
-        return (attr for attr in all_attrs if not attr.startswith("_"))
+            return chain(slot_names, self.__dict__.keys())
+        return chain(slot_names, (attr for attr in self.__dict__ if not attr.startswith("_")))
 
     def _get_attrs(
         self,
@@ -110,10 +110,17 @@ def to_float_timestamp(
         ValueError: If :paramref:`time_object` is a :obj:`datetime.datetime` and
             :paramref:`reference_timestamp` is not :obj:`None`.
     """
+    # Absolute datetimes are the most common input (e.g. `until_date`) and don't depend on the
+    # reference timestamp, so we handle them first and avoid the call to `time.time()`
+    if isinstance(time_object, dtm.datetime):
+        if reference_timestamp is not None:
+            raise ValueError("t is an (absolute) datetime while reference_timestamp is not None")
+        if time_object.tzinfo is None:
+            time_object = _localize(time_object, UTC if tzinfo is None else tzinfo)
+        return time_object.timestamp()
+
     if reference_timestamp is None:
         reference_timestamp = time.time()
-    elif isinstance(time_object, dtm.datetime):
-        raise ValueError("t is an (absolute) datetime while reference_timestamp is not None")
 
     if isinstance(time_object, dtm.timedelta):
         return reference_timestamp + time_object.total_seconds()
@@ -138,10 +145,6 @@ def to_float_timestamp(
         if reference_time > aware_datetime.timetz():
             aware_datetime += dtm.timedelta(days=1)
         return _datetime_to_float_timestamp(aware_datetime)
-    if isinstance(time_object, dtm.datetime):
-        if time_object.tzinfo is None:
-            time_object = _localize(time_object, tzinfo)
-        return _datetime_to_float_timestamp(time_object)
 
     raise TypeError(f"Unable to convert {type(time_object).__name__} object to timestamp")
 
@@ -46,6 +46,9 @@ RT = TypeVar("RT", bound="BaseRequest")
 
 _LOGGER = get_logger(__name__, class_name="BaseRequest")
 
+# Many Bot API methods just return True on success. This is how Telegram encodes that response.
+_TRUE_RESPONSE: Final = b'{"ok":true,"result":true}'
+
 
 class BaseRequest(
     AsyncContextManager["BaseRequest"],
@@ -311,7 +314,7 @@ class BaseRequest(
         # standard deprecation policy and deprecate starting with version 20.7.
         # For our own implementation HTTPXRequest, we can handle that ourselves, so we skip the
         # warning in that case.
-        has_files = request_data and request_data.multipart_data
+        has_files = request_data and request_data.contains_files
         if (
             has_files
             and not isinstance(self, HTTPXRequest)
@@ -403,6 +406,10 @@ class BaseRequest(
         Raises:
             TelegramError: If loading the JSON data failed
         """
+        # Skip decoding & parsing for the most common response
+        if payload == _TRUE_RESPONSE:
+            return {"ok": True, "result": True}
+
         decoded_s = payload.decode("utf-8", "replace")
         try:
             return json.loads(decoded_s)
@@ -178,6 +178,7 @@ class HTTPXRequest(BaseRequest):
             else None
         )
         self._client_kwargs = {
+            "headers": {"User-Agent": self.USER_AGENT},
             "timeout": timeout,
             "proxy": proxy,
             "limits": limits,
@@ -276,7 +277,6 @@ class HTTPXRequest(BaseRequest):
             res = await self._client.request(
                 method=method,
                 url=url,
-                headers={"User-Agent": self.USER_AGENT},
                 timeout=timeout,
                 files=files,
                 data=data,
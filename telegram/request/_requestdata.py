@@ -71,10 +71,11 @@ class RequestData:
             To use a custom library for JSON encoding, you can directly encode the keys of
             :attr:`parameters` - note that string valued keys should not be JSON encoded.
         """
+        # json_value is computed on every access, so we make sure to only access it once
         return {
-            param.name: param.json_value
+            param.name: json_value
             for param in self._parameters
-            if param.json_value is not None
+            if (json_value := param.json_value) is not None
         }
 
     def url_encoded_parameters(self, encode_kwargs: Optional[Dict[str, Any]] = None) -> str:
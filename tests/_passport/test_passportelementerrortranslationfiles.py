@@ -56,27 +56,14 @@ class TestPassportElementErrorTranslationFilesWithoutRequest(
         assert passport_element_error_translation_files.message == self.message
 
     def test_to_dict(self, passport_element_error_translation_files):
-        passport_element_error_translation_files_dict = (
-            passport_element_error_translation_files.to_dict()
-        )
+        inst = passport_element_error_translation_files
+        inst_dict = inst.to_dict()
 
-        assert isinstance(passport_element_error_translation_files_dict, dict)
-        assert (
-            passport_element_error_translation_files_dict["source"]
-            == passport_element_error_translation_files.source
-        )
-        assert (
-            passport_element_error_translation_files_dict["type"]
-            == passport_element_error_translation_files.type
-        )
-        assert (
-            passport_element_error_translation_files_dict["message"]
-            == passport_element_error_translation_files.message
-        )
-        assert (
-            passport_element_error_translation_files_dict["file_hashes"]
-            == passport_element_error_translation_files.file_hashes
-        )
+        assert isinstance(inst_dict, dict)
+        assert inst_dict["source"] == inst.source
+        assert inst_dict["type"] == inst.type
+        assert inst_dict["message"] == inst.message
+        assert inst_dict["file_hashes"] == inst.file_hashes
 
     def test_equality(self):
         a = PassportElementErrorTranslationFiles(self.type_, self.file_hashes, self.message)
@@ -94,6 +94,17 @@ class TestDatetime:
             == 1573431976.1 - timezone.utcoffset(test_datetime).total_seconds()
         )
 
+    def test_to_float_timestamp_absolute_no_clock(self, monkeypatch):
+        """Absolute datetimes don't depend on the current time, so it should not be looked up"""
+
+        def fail():
+            pytest.fail("time.time() should not be called for absolute datetimes")
+
+        monkeypatch.setattr(tg_dtm.time, "time", fail)
+        datetime = dtm.datetime(2019, 11, 11, 0, 26, 16, 10**5)
+        assert tg_dtm.to_float_timestamp(datetime) == 1573431976.1
+        assert tg_dtm.to_timestamp(datetime) == 1573431976
+
     def test_to_float_timestamp_absolute_no_reference(self):
         """A reference timestamp is only relevant for relative time specifications"""
         with pytest.raises(ValueError, match="while reference_timestamp is not None"):
@@ -179,6 +179,14 @@ class TestRequestWithoutRequest:
         # not only implicitly.
         assert httpx_request.parse_json_payload(server_response) == {"result": "test_string�"}
 
+    async def test_true_response(self, monkeypatch, httpx_request: HTTPXRequest):
+        server_response = b'{"ok":true,"result":true}'
+
+        monkeypatch.setattr(httpx_request, "do_request", mocker_factory(response=server_response))
+
+        assert await httpx_request.post(None, None, None) is True
+        assert httpx_request.parse_json_payload(server_response) == json.loads(server_response)
+
     async def test_illegal_json_response(self, monkeypatch, httpx_request: HTTPXRequest, caplog):
         # for proper JSON it should be `"result":` instead of `result:`
         server_response = b'{result: "test_string"}'
@@ -438,6 +446,7 @@ class TestHTTPXRequestWithoutRequest:
     def test_init(self, monkeypatch, proxy_argument):
         @dataclass
         class Client:
+            headers: object
             timeout: object
             proxy: object
             limits: object
@@ -448,6 +457,7 @@ class TestHTTPXRequestWithoutRequest:
         monkeypatch.setattr(httpx, "AsyncClient", Client)
 
         request = HTTPXRequest()
+        assert request._client.headers == {"User-Agent": request.USER_AGENT}
         assert request._client.timeout == httpx.Timeout(connect=5.0, read=5.0, write=5.0, pool=1.0)
         assert request._client.proxy is None
         assert request._client.limits == httpx.Limits(
@@ -652,8 +662,16 @@ class TestHTTPXRequestWithoutRequest:
         )
         assert code == HTTPStatus.OK
 
+    async def test_user_agent_set_on_client(self, httpx_request):
+        assert httpx_request._client.headers["User-Agent"] == httpx_request.USER_AGENT
+
+        # The header must survive re-building the client on re-initialization
+        await httpx_request.shutdown()
+        await httpx_request.initialize()
+        assert httpx_request._client.headers["User-Agent"] == httpx_request.USER_AGENT
+
     async def test_do_request_return_value(self, monkeypatch, httpx_request):
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             return httpx.Response(123, content=b"content")
 
         monkeypatch.setattr(httpx.AsyncClient, "request", make_assertion)
@@ -674,7 +692,7 @@ class TestHTTPXRequestWithoutRequest:
     async def test_do_request_exceptions(
         self, monkeypatch, httpx_request, raised_exception, expected_class, expected_message
     ):
-        async def make_assertion(self, method, url, headers, timeout, files, data):
+        async def make_assertion(self, method, url, timeout, files, data):
             raise raised_exception
 
         monkeypatch.setattr(httpx.AsyncClient, "request", make_assertion)
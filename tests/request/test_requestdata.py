@@ -175,6 +175,21 @@ class TestRequestDataWithoutRequest:
         assert file_rqs.json_parameters == file_jsons
         assert mixed_rqs.json_parameters == mixed_jsons
 
+    def test_json_parameters_dumps_once(self, monkeypatch, simple_rqs, simple_jsons):
+        dumped = []
+        orig_dumps = json.dumps
+
+        def dumps(obj, *args, **kwargs):
+            dumped.append(obj)
+            return orig_dumps(obj, *args, **kwargs)
+
+        monkeypatch.setattr("telegram.request._requestparameter.json.dumps", dumps)
+        assert simple_rqs.json_parameters == simple_jsons
+        # string values are passed as is and must not be dumped at all
+        non_str_values = [v for v in simple_rqs.parameters.values() if not isinstance(v, str)]
+        assert non_str_values
+        assert len(dumped) == len(non_str_values)
+
     def test_json_payload(
         self, simple_rqs, file_rqs, mixed_rqs, simple_jsons, file_jsons, mixed_jsons
     ):
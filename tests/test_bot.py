@@ -1540,6 +1540,25 @@ class TestBotWithoutRequest:
             message_thread_id=1,
         )
 
+    @pytest.mark.parametrize("level", [logging.DEBUG, logging.INFO])
+    async def test_get_updates_logging(self, bot, monkeypatch, caplog, level):
+        async def do_request(*args, **kwargs):
+            return (
+                HTTPStatus.OK,
+                b'{"ok": true, "result": [{"update_id": 1}, {"update_id": 2}]}',
+            )
+
+        monkeypatch.setattr(HTTPXRequest, "do_request", do_request)
+
+        bot = PytestExtBot(get_updates_request=HTTPXRequest(), token=bot.token)
+
+        with caplog.at_level(level, logger="telegram.ext.ExtBot"):
+            updates = await bot.get_updates()
+
+        assert [update.update_id for update in updates] == [1, 2]
+        messages = [record.getMessage() for record in caplog.records]
+        assert ("Getting updates: [1, 2]" in messages) is (level == logging.DEBUG)
+
     # In the following tests we check that get_updates inserts callback data correctly if necessary
     # The same must be done in the webhook updater. This is tested over at test_updater.py, but
     # here we test more extensively.
@@ -171,6 +171,22 @@ class TestTelegramObject:
         subclass_instance = TelegramObjectSubclass()
         assert subclass_instance.to_dict() == {"a": 1}
 
+    def test_to_dict_dict_attributes_not_cached(self):
+        class TelegramObjectSubclass(TelegramObject):
+            """This class doesn't have `__slots__`, so has `__dict__` instead."""
+
+            def __init__(self):
+                super().__init__()
+                self.a = 1
+
+        first, second = TelegramObjectSubclass(), TelegramObjectSubclass()
+        second.b = 2
+        second._c = 3
+        # the slots are cached per class, but the instance attributes must not be
+        assert first.to_dict() == {"a": 1}
+        assert second.to_dict() == {"a": 1, "b": 2}
+        assert first.to_dict() == {"a": 1}
+
     def test_to_dict_api_kwargs(self):
         to = TelegramObject(api_kwargs={"foo": "bar"})
         assert to.to_dict() == {"foo": "bar"}